@@ -15,10 +15,12 @@ import timeit
 import base64
 import inspect
 import logging
+import operator
 import platform
 import warnings
 import tempfile
 import unittest
+import functools
 import threading
 import itertools
 import contextlib
@@ -77,10 +79,27 @@ include_rendering = "INCLUDE_RENDERING" in argv
 if all_dependencies and not trimesh.ray.has_embree:
     import embreex
 
+
+def __getattr__(name):
+    """
+    Lazily import `sympy` as `g.sp` only when a test references
+    it, as importing it adds noticeably to interpreter startup.
+    """
+    if name == "sp":
+        try:
+            import sympy as sp
+        except ImportError:
+            sp = None
+        globals()["sp"] = sp
+        return sp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 try:
-    import sympy as sp
-except ImportError as E:
-    sp = None
+    # parse our truth data with `orjson` if it is available
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 try:
     import jsonschema
@@ -164,6 +183,16 @@ dir_2D = os.path.abspath(os.path.join(dir_current, "..", "models", "2D"))
 # the absolute path for our test data and truth
 dir_data = os.path.abspath(os.path.join(dir_current, "data"))
 
+# the models directory is static during a test run so list it once
+# and keep the names in a deterministic order
+with os.scandir(dir_models) as _entries:
+    models_listing = tuple(sorted(entry.name for entry in _entries))
+# the names of model files which we have a loader for
+_formats = frozenset(trimesh.available_formats())
+models_loadable = tuple(
+    f for f in models_listing if trimesh.util.split_extension(f).lower() in _formats
+)
+
 # a logger for tests to call
 log = logging.getLogger("trimesh")
 log.addHandler(logging.NullHandler())
@@ -220,23 +249,90 @@ def _load_data():
     Load the JSON files from our truth directory.
     """
     data = {}
-    for file_name in os.listdir(dir_data):
-        name, extension = os.path.splitext(file_name)
-        if extension != ".json":
-            continue
-        file_path = os.path.join(dir_data, file_name)
-        with open(file_path, "r") as file_obj:
-            data[name] = json.load(file_obj)
+    with os.scandir(dir_data) as entries:
+        for entry in entries:
+            name, extension = os.path.splitext(entry.name)
+            if extension != ".json":
+                continue
+            with open(entry.path, "rb") as file_obj:
+                data[name] = _json_loads(file_obj.read())
 
-    data["model_paths"] = [os.path.join(dir_models, f) for f in os.listdir(dir_models)]
-    data["2D_files"] = [os.path.join(dir_2D, f) for f in os.listdir(dir_2D)]
+    with os.scandir(dir_models) as entries:
+        data["model_paths"] = [entry.path for entry in entries]
+    with os.scandir(dir_2D) as entries:
+        data["2D_files"] = [entry.path for entry in entries]
     return data
 
 
+def _copy_loaded(loaded):
+    """
+    Copy a cached result from `trimesh.load` so that tests
+    can mutate what they are handed without poisoning the cache.
+
+    Parameters
+    ------------
+    loaded : trimesh.Geometry or trimesh.Scene
+      Result from `trimesh.load`
+
+    Returns
+    ------------
+    copied : trimesh.Geometry or trimesh.Scene
+      Independent copy of the loaded object.
+    """
+    if isinstance(loaded, Trimesh):
+        # cached values are read-only so sharing them is safe
+        copied = loaded.copy(include_cache=True)
+        # `Trimesh.copy` doesn't include per-element attributes
+        copied.face_attributes = deepcopy(loaded.face_attributes)
+        copied.vertex_attributes = deepcopy(loaded.vertex_attributes)
+        # keep whichever ray intersector the loader picked
+        copied.ray = type(loaded.ray)(copied)
+        return copied
+    if isinstance(loaded, trimesh.Scene):
+        # mirror `Scene.copy` but copy each geometry only once
+        # as `Scene.copy` drops geometry caches populated by loaders
+        camera = None
+        if getattr(loaded, "_camera", None) is not None:
+            camera = loaded.camera.copy()
+        return trimesh.Scene(
+            geometry={n: _copy_loaded(g) for n, g in loaded.geometry.items()},
+            graph=loaded.graph.copy(),
+            metadata=loaded.metadata.copy(),
+            camera=camera,
+        )
+    return loaded.copy()
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cached(location):
+    """
+    Load a file by location with memoized results.
+
+    Only the 32 most recently used files are kept alive so
+    memory stays bounded; older entries are evicted and will
+    be loaded from disk again if requested.
+
+    Parameters
+    ------------
+    location : str
+      Absolute path to a model file.
+
+    Returns
+    ------------
+    loaded : trimesh.Geometry or trimesh.Scene
+      Loaded result which must never be mutated.
+    """
+    return trimesh.load(location)
+
+
 def get_mesh(file_name, *args, **kwargs):
     """
     Get a mesh from the models directory by name.
 
+    Loads without keyword arguments are cached and a copy is
+    returned so callers are free to mutate the result. Any
+    keyword arguments bypass the cache and load from disk.
+
     Parameters
     -------------
     file_name : str
@@ -249,14 +345,24 @@ def get_mesh(file_name, *args, **kwargs):
     meshes : trimesh.Trimesh or list
       Single mesh or list of meshes from args
     """
-    meshes = collections.deque()
-    for name in np.append(file_name, args):
+
+    def load(name):
         location = get_path(name)
         log.info("loading mesh from: %s", location)
-        meshes.append(trimesh.load(location, **kwargs))
-    if len(meshes) == 1:
-        return meshes[0]
-    return list(meshes)
+        if kwargs:
+            return trimesh.load(location, **kwargs)
+        return _copy_loaded(_load_cached(location))
+
+    # the common case is a single file
+    if len(args) == 0:
+        return load(file_name)
+
+    # we know how many results we'll have so preallocate
+    names = (file_name,) + args
+    meshes = [None] * len(names)
+    for index, name in enumerate(names):
+        meshes[index] = load(name)
+    return meshes
 
 
 def get_path(file_name):
@@ -324,20 +430,19 @@ def get_meshes(
     mesh : trimesh.Trimesh
       Trimesh objects from models folder
     """
-    # use deterministic file name order
-    file_names = sorted(os.listdir(dir_models))
-
     # count items we've returned as an array so
     # we don't have to make it a global
     returned = [0]
 
-    def check(item):
+    def check(item, watertight=False):
         # only return our limit
         if returned[0] >= count:
             return None
 
-        # run our return argument checks on an item
-        if only_watertight and not item.is_watertight:
+        # run our return argument checks on an item and
+        # only probe watertightness if it was requested
+        # and the item isn't already known to be watertight
+        if only_watertight and not watertight and not item.is_watertight:
             return None
 
         if min_volume is not None and item.volume < min_volume:
@@ -346,43 +451,70 @@ def get_meshes(
         returned[0] += 1
         return item
 
-    for file_name in file_names:
-        extension = trimesh.util.split_extension(file_name).lower()
-        if extension in trimesh.available_formats():
-            try:
-                loaded = trimesh.load(os.path.join(dir_models, file_name))
-            except BaseException as E:
-                if raise_error:
-                    log.error(f"failed to load {file_name}")
-                    raise E
-                continue
+    # only load files we actually have a loader for
+    loadable = models_loadable
+    for file_name in sorted(set(models_listing).difference(loadable)):
+        log.warning("%s has no loader, not running test on!", file_name)
 
-            batched = []
-            if isinstance(loaded, trimesh.Scene):
-                batched.extend(
-                    m for m in loaded.geometry.values() if isinstance(m, trimesh.Trimesh)
-                )
-            elif isinstance(loaded, trimesh.Trimesh):
-                batched.append(loaded)
-
-            for mesh in batched:
-                mesh.metadata["file_name"] = file_name
-                # only return our limit
-                if returned[0] >= count:
-                    return
-                # previous checks should ensure only trimesh
-                assert isinstance(mesh, trimesh.Trimesh)
-                if split:
-                    for submesh in mesh.split(only_watertight=only_watertight):
-                        checked = check(submesh)
-                        if checked is not None:
-                            yield checked
-                else:
-                    checked = check(mesh)
+    # load files one at a time so small counts stop early
+    for file_name in loadable:
+        try:
+            loaded = trimesh.load(os.path.join(dir_models, file_name))
+        except BaseException as E:
+            if raise_error:
+                log.error(f"failed to load {file_name}")
+                raise E
+            continue
+
+        batched = []
+        if isinstance(loaded, trimesh.Scene):
+            batched.extend(
+                m for m in loaded.geometry.values() if isinstance(m, trimesh.Trimesh)
+            )
+        elif isinstance(loaded, trimesh.Trimesh):
+            batched.append(loaded)
+
+        for mesh in batched:
+            mesh.metadata["file_name"] = file_name
+            # only return our limit
+            if returned[0] >= count:
+                return
+            # previous checks should ensure only trimesh
+            assert isinstance(mesh, trimesh.Trimesh)
+            if split:
+                # `split` has already repaired and filtered
+                # for watertightness if it was requested
+                for submesh in mesh.split(only_watertight=only_watertight):
+                    checked = check(submesh, watertight=only_watertight)
                     if checked is not None:
                         yield checked
-        else:
-            log.warning("%s has no loader, not running test on!", file_name)
+            else:
+                checked = check(mesh)
+                if checked is not None:
+                    yield checked
+
+
+@functools.lru_cache(maxsize=32)
+def _load_2D_cached(location, mtime):
+    """
+    Load a 2D drawing by location with memoized results.
+
+    Only the 32 most recently used drawings are kept alive and
+    keying on modification time means edited files are reloaded.
+
+    Parameters
+    ------------
+    location : str
+      Absolute path to a drawing file.
+    mtime : int
+      Modification time of the file in nanoseconds.
+
+    Returns
+    ------------
+    loaded : trimesh.path.Path2D
+      Loaded result which must never be mutated.
+    """
+    return trimesh.load(location)
 
 
 def get_2D(count=None):
@@ -404,29 +536,31 @@ def get_2D(count=None):
         raise StopIteration
 
     # all files in the 2D models directory
-    listdir = sorted(os.listdir(dir_2D))
+    with os.scandir(dir_2D) as entries:
+        listdir = sorted(entries, key=operator.attrgetter("name"))
     # if count isn't passed return all files
     if count is None:
         count = len(listdir)
-    # save resulting loaded paths
-    paths = []
-    for file_name in listdir:
+    # number of paths we've yielded
+    returned = 0
+    formats = frozenset(trimesh.available_formats())
+    for entry in listdir:
         # check to see if the file is loadable
-        ext = trimesh.util.split_extension(file_name)
-        if ext not in trimesh.available_formats():
+        ext = trimesh.util.split_extension(entry.name)
+        if ext not in formats:
             continue
-        # full path
-        location = os.path.join(dir_2D, file_name)
         try:
-            paths.append(trimesh.load(location))
+            # hand out a copy so tests can mutate the result
+            path = _copy_loaded(_load_2D_cached(entry.path, entry.stat().st_mtime_ns))
         except BaseException as E:
-            log.error("failed on: {}".format(file_name), exc_info=True)
+            log.error("failed on: {}".format(entry.name), exc_info=True)
             raise E
 
-        yield paths[-1]
+        yield path
+        returned += 1
 
         # if we don't need every path break
-        if len(paths) >= count:
+        if returned >= count:
             break
 
 
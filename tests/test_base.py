@@ -67,39 +67,62 @@ class MeshTests(g.unittest.TestCase):
         mesh = g.get_mesh("tube.obj")
         mesh.units = "in"
 
-        # loop through string property names
-        for method in dir(mesh):
-            # ignore private- ish methods
-            if method.startswith("_"):
-                continue
-            # a string expression to evaluate
-            expr = f"mesh.{method}"
-
-            try:
-                # get the value of that expression
-                res = eval(expr)
-            except ImportError:
-                g.log.warning("unable to import!", exc_info=True)
-                continue
-
+        # properties which should never be None
+        # expensive ones are already exercised in `test_mesh`
+        properties = [
+            "area",
+            "area_faces",
+            "bounds",
+            "bounding_box",
+            "bounding_box_oriented",
+            "center_mass",
+            "centroid",
+            "edges",
+            "edges_unique",
+            "euler_number",
+            "extents",
+            "face_normals",
+            "faces",
+            "identifier",
+            "identifier_hash",
+            "is_volume",
+            "is_watertight",
+            "mass_properties",
+            "moment_inertia",
+            "principal_inertia_components",
+            "scale",
+            "symmetry",
+            "symmetry_axis",
+            "symmetry_section",
+            "units",
+            "vertex_normals",
+            "vertices",
+            "volume",
+        ]
+        for method in properties:
             # shouldn't be None!
-            assert res is not None
+            assert getattr(mesh, method) is not None, method
 
-        # check methods in scene objects
+        # check properties of scene objects
         scene = mesh.scene()
-        # camera will be None unless set
-        blacklist = ["camera"]
-        for method in dir(scene):
-            # ignore private- ish methods
-            if method.startswith("_") or method in blacklist:
-                continue
-            # a string expression to evaluate
-            expr = f"scene.{method}"
-            # get the value of that expression
-            res = eval(expr)
+        properties = [
+            "bounds",
+            "bounds_corners",
+            "centroid",
+            "convex_hull",
+            "duplicate_nodes",
+            "extents",
+            "geometry",
+            "graph",
+            "scale",
+            "triangles",
+            "triangles_node",
+            "units",
+        ]
+        for method in properties:
             # shouldn't be None!
-            if res is None:
-                raise ValueError(f'"{expr}" is None!!')
+            if getattr(scene, method) is None:
+                raise ValueError(f'"scene.{method}" is None!!')
 
 
 if __name__ == "__main__":
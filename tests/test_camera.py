@@ -31,10 +31,18 @@ class CameraTests(g.unittest.TestCase):
         fov = (60, 40)
         camera = g.trimesh.scene.Camera(resolution=resolution, focal=focal, fov=fov)
         assert np.allclose(camera.fov, fov)
-        camera = g.trimesh.scene.Camera(
-            resolution=resolution, focal=camera.focal, fov=None
+        # explicitly setting focal should derive fov from it
+        camera.focal = camera.focal
+        expected = 2.0 * np.degrees(
+            np.arctan((np.array(resolution) / 2.0) / camera.focal)
         )
+        assert np.allclose(camera.fov, expected)
+        # and fov recomputed from focal should match
         assert np.allclose(camera.fov, fov)
+        # with focal fixed fov should follow the resolution
+        camera.resolution = (640, 480)
+        expected = 2.0 * np.degrees(np.arctan(np.array([320, 240]) / camera.focal))
+        assert np.allclose(camera.fov, expected)
 
     def test_focal_updates_on_resolution_change(self):
         """
@@ -8,10 +8,11 @@ class SegmentsTest(g.unittest.TestCase):
     def test_param(self):
         from trimesh.path import segments
 
+        rng = g.np.random.default_rng(12345)
         # check 2D and 3D
         for dimension in [2, 3]:
             # a bunch of random line segments
-            s = g.random((100, 2, dimension))
+            s = rng.random((100, 2, dimension))
             # convert segment to point on line closest to origin
             # as well as a vector and two distances along vector
             param = segments.segments_to_parameters(s)
@@ -22,7 +23,9 @@ class SegmentsTest(g.unittest.TestCase):
 
             # make index 1 the first segment but offset along vector
             # IE make s[0] colinear with s[1]
-            s[1] = s[0] + 10 * (s[0][0] - s[0][1])
+            direction = s[0, 0] - s[0, 1]
+            direction *= 10
+            g.np.add(s[0], direction, out=s[1])
             # calculate colinear pairs
             colinear = segments.colinear_pairs(s)
 
@@ -75,12 +78,13 @@ class SegmentsTest(g.unittest.TestCase):
     def test_extrude(self):
         from trimesh.path.segments import extrude
 
+        rng = g.np.random.default_rng(12345)
         # hand tuned segments
         manual = g.np.column_stack(
             (g.np.zeros((3, 2)), [[0, 1], [0, -1], [1, 2]])
         ).reshape((-1, 2, 2))
 
-        for seg in [manual, g.random((10, 2, 2))]:
+        for seg in [manual, rng.random((10, 2, 2))]:
             height = 1.22
             v, f = extrude(segments=seg, height=height)
             # load extrusion as mesh
@@ -93,8 +97,9 @@ class SegmentsTest(g.unittest.TestCase):
     def test_resample(self):
         from trimesh.path.segments import length, resample
 
+        rng = g.np.random.default_rng(12345)
         # create some random segments
-        seg = g.random((1000, 2, 3))
+        seg = rng.random((1000, 2, 3))
         # set a maximum segment length
         maxlen = 0.1
         # one of the original segments should be longer than maxlen
@@ -141,8 +146,9 @@ class SegmentsTest(g.unittest.TestCase):
     def test_svg(self):
         from trimesh.path.segments import to_svg
 
+        rng = g.np.random.default_rng(12345)
         # create some 2D segments
-        seg = g.random((1000, 2, 2))
+        seg = rng.random((1000, 2, 2))
         # make one of the segments a duplicate
         seg[0] = seg[-1]
         # create an SVG path string
@@ -162,7 +168,7 @@ class SegmentsTest(g.unittest.TestCase):
         assert svg.count("L") < len(seg)
 
         try:
-            to_svg(g.random((100, 2, 3)))
+            to_svg(rng.random((100, 2, 3)))
         except ValueError:
             return
         raise ValueError("to_svg accepted wrong input!")
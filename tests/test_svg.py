@@ -66,6 +66,88 @@ class ExportTest(g.unittest.TestCase):
 
         assert g.np.isclose(aR.area, a.area)
 
+    def test_entity_metadata(self):
+        p = g.get_mesh("2D/wrench.dxf")
+        # keys that start with characters from the namespace URL
+        p.entities[0].metadata.update({"color_name": "red", "metadata": "hi"})
+        r = g.trimesh.load(g.io_wrap(p.export(file_type="svg")), file_type="svg")
+        meta = r.entities[0].metadata
+        assert meta["color_name"] == "red"
+        assert meta["metadata"] == "hi"
+
+        # values of None should be skipped rather than raising
+        p.entities[0].metadata["empty"] = None
+        r = g.trimesh.load(g.io_wrap(p.export(file_type="svg")), file_type="svg")
+        assert "empty" not in r.entities[0].metadata
+
+    def test_arc_info(self):
+        from trimesh.path.arc import arc_center
+        from trimesh.path.exchange.svg_io import _arc_svg_info
+
+        p = g.get_mesh("2D/tray-easy1.svg")
+        arcs = [e for e in p.entities if type(e).__name__ == "Arc"]
+        vertices = p.vertices[[e.points for e in arcs]]
+        assert len(vertices) > 0
+
+        # the batched arcs should match evaluating them one at a time
+        center, radius, large, _ = _arc_svg_info(vertices)
+        for i, v in enumerate(vertices):
+            info = arc_center(v, return_normal=False, return_angle=True)
+            assert g.np.allclose(info.center, center[i])
+            assert g.np.isclose(info.radius, radius[i])
+            assert (info.span > g.np.pi) == large[i]
+
+    def test_parse_path(self):
+        from svg.path import parse_path
+        from svg.path.parser import InvalidPathError
+
+        from trimesh.path.exchange.svg_io import _parse_path, _parse_path_fast
+
+        paths = [
+            "M 0 0 L 10 0 H 20 V 10 Z",
+            "m 1 1 l 2 2 h 3 v -4 z m 5 5 10 10",
+            "M0 0 C 1 2 3 4 5 6 S 7 8 9 10 s 1 1 2 2",
+            "M0 0 c 1 2 3 4 5 6 C 1 1 2 2 3 3 S 4 4 5 5",
+            "M0 0 Q 1 1 2 0 T 4 0 t 2 0 q 1 1 2 0",
+            "M0 0 T 4 0 Q 5 5 6 0 T 8 0",
+            "M 0 0 A 5 5 0 0 1 10 0 a 5 5 30 1 0 -10 0",
+            "M 0 0 A5 5 0 1010 0",
+            "M1e2-3e-1 .5.5 L-1.5e+1,2E1",
+            "M.5.5.5.5 l1-1-1-1",
+            "L 1 1 2 2",
+        ]
+        for d in paths:
+            fast = _parse_path_fast(d)
+            truth = list(parse_path(d))
+            assert fast == truth
+            # flags not compared by `__eq__` should also match
+            for a, b in zip(fast, truth):
+                assert type(a) is type(b)
+                assert a.relative == b.relative
+                assert getattr(a, "smooth", None) == getattr(b, "smooth", None)
+
+        # malformed paths should raise in the fast parser
+        for d in ["M0 0 L 1", "M0 0 L1 1 2", "M 0 0 A -1 1 0 0 1 1 1", "0 0"]:
+            with self.assertRaises(ValueError):
+                _parse_path_fast(d)
+        # and fall back to `svg.path` which is more lenient
+        assert _parse_path("M0 0 L1 1 2") == list(parse_path("M0 0 L1 1 2"))
+        # or raises its own error
+        with self.assertRaises(InvalidPathError):
+            _parse_path("M0 0 L 1")
+
+    def test_bezier(self):
+        p = g.get_mesh("2D/MIL.svg")
+        assert any(type(e).__name__ == "Bezier" for e in p.entities)
+        # curves should be exported as curves rather than polylines
+        path = g.trimesh.path.exchange.svg_io.export_svg(p, return_path=True)
+        assert "C" in path
+
+        r = g.trimesh.load(g.io_wrap(p.export(file_type="svg")), file_type="svg")
+        assert len(r.entities) == len(p.entities)
+        assert g.np.isclose(r.length, p.length)
+        assert g.np.isclose(r.area, p.area)
+
     def test_trans(self):
         from trimesh.path.exchange.svg_io import transform_to_matrices as tf
 
@@ -90,6 +172,11 @@ class ExportTest(g.unittest.TestCase):
         # check the matrix string
         assert g.np.allclose(a[1], [[0, 2, 4], [1, 3, 5], [0, 0, 1]])
 
+        # results are cached so repeated strings share read-only matrices
+        b = tf(" translate(1.1    1.2   )       ")
+        assert b[0] is tf(" translate(1.1    1.2   )       ")[0]
+        assert not b[0].flags["WRITEABLE"]
+
     def test_roundtrip(self):
         """
         Check to make sure a roundtrip from both a Scene and a
@@ -47,6 +47,27 @@ class TrianglesTest(g.unittest.TestCase):
         assert (comparison < 1e-8).all()
         g.log.info("finished closest check on %d triangles", len(closest))
 
+    def test_closest_cache(self):
+        triangles = g.data["triangles"]["triangles"]
+        points = g.np.array(g.data["triangles"]["points"])
+        cache = g.trimesh.triangles.precompute_closest(triangles)
+
+        # the cache should be reusable for different queries
+        for query in [points, points[::-1], points * 2.0]:
+            assert g.np.allclose(
+                g.trimesh.triangles.closest_point(cache, query),
+                g.trimesh.triangles.closest_point(triangles, query),
+            )
+
+        # points still need to correspond to the cached triangles
+        with self.assertRaises(ValueError):
+            g.trimesh.triangles.closest_point(cache, points[:-1])
+
+        # lower precision should be opt-in and close to the result
+        single = g.trimesh.triangles.closest_point(triangles, points, dtype=g.np.float32)
+        assert single.dtype == g.np.float32
+        assert g.np.allclose(single, g.data["triangles"]["closest"], atol=1e-3)
+
     def test_closest_obtuse(self):
         # simple triangle in the xy-plane with an obtuse corner at vertex A
         ABC = g.np.float32([[0, 0, 0], [2, 0, 0], [-2, 1, 0]])
@@ -162,6 +183,57 @@ class TrianglesTest(g.unittest.TestCase):
             [g.np.arcsin(3.0 / 5), g.np.arcsin(4.0 / 5), g.np.pi / 2],
         )
 
+    def test_coplanar(self):
+        m = g.trimesh.creation.box()
+        # every box face has a coplanar neighbor but isn't flat
+        assert g.trimesh.triangles.any_coplanar(m.triangles)
+        assert not g.trimesh.triangles.all_coplanar(m.triangles)
+
+        # no two faces of a sphere share a plane
+        tris = g.trimesh.creation.icosphere(subdivisions=4).triangles.copy()
+        assert len(tris) > g.trimesh.triangles._COPLANAR_BLOCK
+        assert not g.trimesh.triangles.any_coplanar(tris)
+        assert not g.trimesh.triangles.all_coplanar(tris)
+
+        # flatten the sphere so every triangle is in one plane
+        tris[:, :, 2] = 0.0
+        assert g.trimesh.triangles.any_coplanar(tris)
+        assert g.trimesh.triangles.all_coplanar(tris)
+
+        # a degenerate first triangle should use the next plane
+        tris[0] = tris[0][0]
+        assert g.trimesh.triangles.all_coplanar(tris)
+
+    def test_windings_aligned(self):
+        m = g.trimesh.creation.icosphere()
+        tris = m.triangles.copy()
+        normals = m.face_normals
+
+        assert g.trimesh.triangles.windings_aligned(tris, normals).all()
+        assert not g.trimesh.triangles.windings_aligned(tris, -normals).any()
+
+        # degenerate triangles should never be aligned
+        tris[0] = tris[0][0]
+        aligned = g.trimesh.triangles.windings_aligned(tris, normals)
+        assert not aligned[0]
+        assert aligned[1:].all()
+
+    def test_validate(self):
+        tris = g.trimesh.creation.box().triangles
+        for func in [
+            g.trimesh.triangles.mass_properties,
+            g.trimesh.triangles.extents,
+            g.trimesh.triangles.nondegenerate,
+            g.trimesh.triangles.to_kwargs,
+        ]:
+            # lists and integer arrays should be converted
+            func(tris.tolist())
+            func(triangles=tris.astype(g.np.int64))
+            # incorrect shapes should raise
+            for bad in [tris[:, :2], tris.reshape((-1, 3)), tris[:, :, :2]]:
+                with self.assertRaises(ValueError):
+                    func(bad)
+
 
 if __name__ == "__main__":
     g.trimesh.util.attach_to_log()
@@ -58,32 +58,9 @@ def arc_center(
     """
     points = np.asanyarray(points, dtype=np.float64)
 
-    # get the non-unit vectors of the three points
-    vectors = points[[2, 0, 1]] - points[[1, 2, 0]]
-    # we need both the squared row sum and the non-squared
-    abc2 = np.dot(vectors**2, [1] * points.shape[1])
-    # same as np.linalg.norm(vectors, axis=1)
-    abc = np.sqrt(abc2)
-
-    # perform radius calculation scaled to shortest edge
-    # to avoid precision issues with small or large arcs
-    scale = abc.min()
-    # get the edge lengths scaled to the smallest
-    edges = abc / scale
-    # half the total length of the edges
-    half = edges.sum() / 2.0
-    # check the denominator for the radius calculation
-    denom = half * np.prod(half - edges)
-    if denom < tol.merge:
-        raise ValueError("arc is colinear!")
-    # find the radius and scale back after the operation
-    radius = scale * ((np.prod(edges) / 4.0) / np.sqrt(denom))
-
-    # use a barycentric approach to get the center
-    ba2 = (abc2[[1, 2, 0, 0, 2, 1, 0, 1, 2]] * [1, 1, -1, 1, 1, -1, 1, 1, -1]).reshape(
-        (3, 3)
-    ).sum(axis=1) * abc2
-    center = points.T.dot(ba2) / ba2.sum()
+    # evaluate the single arc with the batched helper
+    center, radius = _arc_center_radius(points[None])
+    center, radius = center[0], radius[0]
 
     if tol.strict:
         # all points should be at the calculated radius from center
@@ -92,6 +69,8 @@ def arc_center(
     # start with initial results
     result = {"center": center, "radius": radius}
     if return_normal:
+        # get the non-unit vectors of the three points
+        vectors = points[[2, 0, 1]] - points[[1, 2, 0]]
         if points.shape == (3, 2):
             # for 2D arcs still use the cross product so that
             # the sign of the normal vector is consistent
@@ -105,30 +84,99 @@ def arc_center(
     if return_angle:
         # vectors from points on arc to center point
         vector = util.unitize(points - center)
-        edge_direction = np.diff(points, axis=0)
-        # find the angle between the first and last vector
-        dot = np.dot(*vector[[0, 2]])
-        if dot < (_TOL_ZERO - 1):
-            angle = np.pi
-        elif dot > 1 - _TOL_ZERO:
-            angle = 0.0
-        else:
-            angle = np.arccos(dot)
-        # if the angle is nonzero and vectors are opposite direction
-        # it means we have a long arc rather than the short path
-        if abs(angle) > _TOL_ZERO and np.dot(*edge_direction) < 0.0:
-            angle = (np.pi * 2) - angle
         # convoluted angle logic
         angles = np.arctan2(*vector[:, :2].T[::-1]) + np.pi * 2
         angles_sorted = np.sort(angles[[0, 2]])
         reverse = angles_sorted[0] < angles[1] < angles_sorted[1]
         angles_sorted = angles_sorted[:: (1 - int(not reverse) * 2)]
         result["angles"] = angles_sorted
-        result["span"] = angle
+        result["span"] = _arc_span(vector[None], points[None])[0]
 
     return ArcInfo(**result)
 
 
+def _arc_center_radius(points: NDArray[float64]):
+    """
+    Find the center and radius of many three point arcs at once.
+
+    Parameters
+    ---------
+    points : (n, 3, dimension) float
+      Start, middle and end point of each arc.
+
+    Returns
+    ---------
+    center : (n, dimension) float
+      Center of each arc.
+    radius : (n,) float
+      Radius of each arc.
+
+    Raises
+    ---------
+    ValueError
+      If any of the arcs are colinear.
+    """
+    # get the non-unit vectors of the three points
+    vectors = points[:, [2, 0, 1]] - points[:, [1, 2, 0]]
+    # we need both the squared row sum and the non-squared
+    abc2 = (vectors**2).sum(axis=2)
+    # same as np.linalg.norm(vectors, axis=2)
+    abc = np.sqrt(abc2)
+
+    # perform radius calculation scaled to shortest edge
+    # to avoid precision issues with small or large arcs
+    scale = abc.min(axis=1)
+    # get the edge lengths scaled to the smallest
+    edges = abc / scale[:, None]
+    # half the total length of the edges
+    half = edges.sum(axis=1) / 2.0
+    # check the denominator for the radius calculation
+    denom = half * np.prod(half[:, None] - edges, axis=1)
+    if (denom < tol.merge).any():
+        raise ValueError("arc is colinear!")
+    # find the radius and scale back after the operation
+    radius = scale * ((np.prod(edges, axis=1) / 4.0) / np.sqrt(denom))
+
+    # use a barycentric approach to get the center
+    ba2 = (abc2[:, [1, 2, 0, 0, 2, 1, 0, 1, 2]] * [1, 1, -1, 1, 1, -1, 1, 1, -1]).reshape(
+        (-1, 3, 3)
+    ).sum(axis=2) * abc2
+    center = (points.transpose(0, 2, 1) @ ba2[:, :, None])[:, :, 0]
+    center /= ba2.sum(axis=1)[:, None]
+
+    return center, radius
+
+
+def _arc_span(vectors: NDArray[float64], points: NDArray[float64]):
+    """
+    Find the angular span of many three point arcs at once.
+
+    Parameters
+    ---------
+    vectors : (n, 3, dimension) float
+      Unit vectors from the center to each point on the arc.
+    points : (n, 3, dimension) float
+      Start, middle and end point of each arc.
+
+    Returns
+    ---------
+    span : (n,) float
+      Angular span of each arc in radians.
+    """
+    # find the angle between the first and last vector
+    dot = (vectors[:, 0] * vectors[:, 2]).sum(axis=1)
+    span = np.arccos(np.clip(dot, -1.0, 1.0))
+    span[dot < (_TOL_ZERO - 1)] = np.pi
+    span[dot > 1 - _TOL_ZERO] = 0.0
+    # if the angle is nonzero and vectors are opposite direction
+    # it means we have a long arc rather than the short path
+    edge_direction = np.diff(points, axis=1)
+    turned = (edge_direction[:, 0] * edge_direction[:, 1]).sum(axis=1) < 0.0
+    long = turned & (np.abs(span) > _TOL_ZERO)
+    span[long] = (np.pi * 2) - span[long]
+    return span
+
+
 def discretize_arc(points, close=False, scale=1.0):
     """
     Returns a version of a three point arc consisting of
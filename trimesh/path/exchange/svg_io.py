@@ -1,25 +1,35 @@
 import base64
-import collections
 import json
-from copy import deepcopy
+import re
+from functools import lru_cache, reduce
 
 import numpy as np
 
-from ... import exceptions, grouping, resources, util
+from ... import exceptions, resources, util
 from ...constants import log, tol
-from ...transformations import planar_matrix, transform_points
-from ...typed import NDArray, Number
+from ...transformations import planar_matrix
 from ...util import jsonify
-from ..arc import arc_center
+from ..arc import _arc_center_radius, _arc_span
 from ..entities import Arc, Bezier, Line
 
 try:
     # pip install svg.path
+    from svg.path import Arc as _SvgArc
+    from svg.path import Close as _SvgClose
+    from svg.path import CubicBezier as _SvgCubic
+    from svg.path import Line as _SvgLine
+    from svg.path import Move as _SvgMove
+    from svg.path import QuadraticBezier as _SvgQuadratic
     from svg.path import parse_path
 except BaseException as E:
     # will re-raise the import exception when
     # someone tries to call `parse_path`
     parse_path = exceptions.ExceptionWrapper(E)
+    # placeholder types which never match anything
+    _SvgArc = _SvgClose = _SvgCubic = _SvgLine = _SvgMove = _SvgQuadratic = type(None)
+
+# svg.path entities which we combine into a single Line
+_SVG_LINE_TYPES = (_SvgLine, _SvgClose)
 
 try:
     from lxml import etree
@@ -32,10 +42,34 @@ except BaseException as E:
 _ns_name = "trimesh"
 _ns_url = "https://github.com/mikedh/trimesh"
 _ns = f"{{{_ns_url}}}"
+# length of the namespace prefix to slice off of attribute keys
+_ns_len = len(_ns)
+# precomputed namespaced attribute keys
+_ns_key_class = _ns + "class"
+_ns_key_metadata = _ns + "metadata"
+_ns_key_metadata_geometry = _ns + "metadata_geometry"
+_ns_key_name = _ns + "name"
 
 _IDENTITY = np.eye(3)
 _IDENTITY.flags["WRITEABLE"] = False
 
+# split a path string into commands and their arguments
+_COMMAND_RE = re.compile(r"([MmZzLlHhVvCcSsQqTtAa])")
+# a floating point number including scientific notation
+_NUMBER = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+# match either a number or an unexpected non-separator character
+_NUMBER_RE = re.compile(rf"({_NUMBER})|[^\s,]")
+# one set of arc arguments: flags are single characters
+# which are allowed to omit any separator
+_ARC_RE = re.compile(
+    r"[\s,]*".join(
+        ["", f"({_NUMBER})", f"({_NUMBER})", f"({_NUMBER})", "([01])", "([01])"]
+        + [f"({_NUMBER})", f"({_NUMBER})", ""]
+    )
+)
+# how many numbers each command consumes
+_ARG_COUNT = {"M": 2, "L": 2, "H": 1, "V": 1, "C": 6, "S": 4, "Q": 4, "T": 2, "A": 7}
+
 
 def svg_to_path(file_obj=None, file_type=None, path_string=None):
     """
@@ -79,36 +113,57 @@ def svg_to_path(file_obj=None, file_type=None, path_string=None):
             return _IDENTITY
         elif len(matrices) == 1:
             return matrices[0]
-        else:
-            return util.multi_dot(matrices[::-1])
+        elif len(matrices) == 2:
+            return matrices[1] @ matrices[0]
+        # the matrices are all (3, 3) so there is no cheaper ordering
+        # and a plain reduction avoids the overhead of `multi_dot`
+        return reduce(np.matmul, reversed(matrices))
 
     force = None
     if file_obj is not None:
-        # first parse the XML
-        tree = etree.fromstring(file_obj.read())
+        # `iterparse` requires a stream which returns bytes
+        if isinstance(file_obj.read(0), str):
+            file_obj = util.wrap_as_stream(file_obj.read().encode("utf-8"))
+        # the root element which holds any trimesh attributes
+        tree = None
         # store paths and transforms as
-        # (path string, 3x3 matrix)
+        # (path attributes, 3x3 matrix)
         paths = []
-        for element in tree.iter("{*}path"):
+        # stream the XML so processed elements can be freed
+        for event, element in etree.iterparse(file_obj, events=("start", "end")):
+            if tree is None:
+                # the first event is the start of the root element
+                tree = element
+                continue
+            elif event != "end" or not (
+                element.tag == "path" or element.tag.endswith("}path")
+            ):
+                continue
             # store every path element attributes and transform
-            paths.append((element.attrib, element_transform(element)))
+            # copying the attributes as the element is about to be cleared
+            paths.append((dict(element.attrib), element_transform(element)))
+            # free the path and any earlier siblings which
+            # have already been completely processed
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
 
         try:
             # see if the SVG should be reproduced as a scene
-            force = tree.attrib[_ns + "class"]
+            force = tree.attrib[_ns_key_class]
         except BaseException:
             pass
 
     elif path_string is not None:
         # parse a single SVG path string
-        paths = [({"d": path_string}, np.eye(3))]
+        paths = [({"d": path_string}, _IDENTITY)]
     else:
         raise ValueError("`file_obj` or `pathstring` required")
 
     result = _svg_path_convert(paths=paths, force=force)
     try:
         # get overall metadata from JSON string if it exists
-        result["metadata"] = _decode(tree.attrib[_ns + "metadata"])
+        result["metadata"] = _decode(tree.attrib[_ns_key_metadata])
     except KeyError:
         # not in the trimesh ns
         pass
@@ -121,7 +176,7 @@ def svg_to_path(file_obj=None, file_type=None, path_string=None):
     if "geometry" in result:
         try:
             # get per-geometry metadata if available
-            bag = _decode(tree.attrib[_ns + "metadata_geometry"])
+            bag = _decode(tree.attrib[_ns_key_metadata_geometry])
             for name, meta in bag.items():
                 if name in result["geometry"]:
                     # assign this metadata to the geometry
@@ -136,6 +191,49 @@ def svg_to_path(file_obj=None, file_type=None, path_string=None):
     return result
 
 
+def _op_translate(values):
+    # convert translation to a (3, 3) homogeneous matrix
+    matrix = _IDENTITY.copy()
+    matrix[:2, 2] = values
+    return matrix
+
+
+def _op_matrix(values):
+    # [a b c d e f] ->
+    # [[a c e],
+    #  [b d f],
+    #  [0 0 1]]
+    return np.vstack((values.reshape((3, 2)).T, [0, 0, 1]))
+
+
+def _op_rotate(values):
+    # SVG rotations are in degrees
+    angle = np.degrees(values[0])
+    # if there are three values rotate around point
+    if len(values) == 3:
+        point = values[1:]
+    else:
+        point = None
+    return planar_matrix(theta=angle, point=point)
+
+
+def _op_scale(values):
+    # supports (x_scale, y_scale) or (scale)
+    matrix = _IDENTITY.copy()
+    matrix[:2, :2] *= values
+    return matrix
+
+
+# functions to convert transform arguments to a matrix
+_OP = {
+    "translate": _op_translate,
+    "matrix": _op_matrix,
+    "rotate": _op_rotate,
+    "scale": _op_scale,
+}
+
+
+@lru_cache(maxsize=4096)
 def transform_to_matrices(transform):
     """
     Convert an SVG transform string to an array of matrices.
@@ -152,8 +250,8 @@ def transform_to_matrices(transform):
 
     Returns
     -----------
-    matrices : (n, 3, 3) float
-      Multiple transformation matrices from input transform string
+    matrices : tuple of (3, 3) float
+      Read-only transformation matrices from input transform string
     """
     # split the transform string in to components of:
     # (operation, args) i.e. (translate, '-1.0, 2.0')
@@ -170,37 +268,252 @@ def transform_to_matrices(transform):
         elif len(line) != 2:
             raise ValueError("should always have two components!")
         key, args = line
+        op = _OP.get(key)
+        if op is None:
+            log.debug(f"unknown SVG transform: {key}")
+            continue
         # convert string args to array of floats
         # support either comma or space delimiter
-        values = np.array([float(i) for i in args.replace(",", " ").split()])
-        if key == "translate":
-            # convert translation to a (3, 3) homogeneous matrix
-            matrices.append(_IDENTITY.copy())
-            matrices[-1][:2, 2] = values
-        elif key == "matrix":
-            # [a b c d e f] ->
-            # [[a c e],
-            #  [b d f],
-            #  [0 0 1]]
-            matrices.append(np.vstack((values.reshape((3, 2)).T, [0, 0, 1])))
-        elif key == "rotate":
-            # SVG rotations are in degrees
-            angle = np.degrees(values[0])
-            # if there are three values rotate around point
-            if len(values) == 3:
-                point = values[1:]
-            else:
-                point = None
-            matrices.append(planar_matrix(theta=angle, point=point))
-        elif key == "scale":
-            # supports (x_scale, y_scale) or (scale)
-            mat = _IDENTITY.copy()
-            mat[:2, :2] *= values
-            matrices.append(mat)
-        else:
-            log.debug(f"unknown SVG transform: {key}")
+        matrix = op(np.array(args.replace(",", " ").split(), dtype=np.float64))
+        # results are cached so they must not be mutated
+        matrix.flags["WRITEABLE"] = False
+        matrices.append(matrix)
+
+    return tuple(matrices)
+
+
+def _parse_path(path_string):
+    """
+    Parse an SVG path string into `svg.path` segments.
+
+    Uses a fast parser for well-formed path strings and
+    falls back to `svg.path.parse_path` for anything else.
+
+    Parameters
+    ------------
+    path_string : str
+      SVG path data, i.e. the `d` attribute.
+
+    Returns
+    ------------
+    segments : list
+      Parsed `svg.path` segment objects.
+    """
+    try:
+        return _parse_path_fast(path_string)
+    except BaseException:
+        log.debug("falling back to `svg.path`", exc_info=True)
+    return list(parse_path(path_string))
+
+
+def _parse_numbers(command, args):
+    """
+    Parse the argument string for a single path command.
+
+    Parameters
+    ------------
+    command : str
+      Uppercase path command, i.e. `L`
+    args : str
+      Arguments following the command.
+
+    Returns
+    ------------
+    values : list
+      Flat list of argument values.
+    """
+    if command != "A":
+        values = []
+        for match in _NUMBER_RE.finditer(args):
+            number = match.group(1)
+            if number is None:
+                raise ValueError(f"unexpected `{match.group(0)}` in path")
+            values.append(float(number))
+        return values
+
+    # arcs have flags which may omit separators
+    values = []
+    position = 0
+    while position < len(args):
+        match = _ARC_RE.match(args, position)
+        if match is None:
+            if len(args[position:].strip(" \t\r\n,")) == 0:
+                break
+            raise ValueError("unable to parse arc arguments")
+        groups = match.groups()
+        if float(groups[0]) < 0.0 or float(groups[1]) < 0.0:
+            raise ValueError("arc radii must be non-negative")
+        values.extend(
+            [
+                float(groups[0]),
+                float(groups[1]),
+                float(groups[2]),
+                groups[3] == "1",
+                groups[4] == "1",
+                float(groups[5]),
+                float(groups[6]),
+            ]
+        )
+        position = match.end()
+    return values
+
+
+def _parse_path_fast(path_string):
+    """
+    Parse an SVG path string into `svg.path` segments, which
+    is equivalent to `svg.path.parse_path` including the
+    `relative` and `smooth` flags, but tokenizes each command's
+    arguments with a single regular expression pass.
+
+    Parameters
+    ------------
+    path_string : str
+      SVG path data, i.e. the `d` attribute.
+
+    Returns
+    ------------
+    segments : list
+      Parsed `svg.path` segment objects.
+
+    Raises
+    ------------
+    ValueError
+      If the path string isn't well-formed.
+    """
+    split = _COMMAND_RE.split(path_string)
+    if len(split[0].strip()) > 0:
+        raise ValueError("path must start with a command")
+
+    segments = []
+    # the start of the current subpath
+    start = None
+    # the current pen position
+    current = 0j
+    # the previous command for smooth curves
+    last = None
+
+    for command, args in zip(split[1::2], split[2::2]):
+        relative = command.islower()
+        command = command.upper()
+
+        if command == "Z":
+            if start is None or len(args.strip(" \t\r\n,")) > 0:
+                raise ValueError("unexpected close")
+            segments.append(_SvgClose(current, start, relative=relative))
+            current = start
+            last = command
+            continue
+
+        values = _parse_numbers(command, args)
+        count = _ARG_COUNT[command]
+        if len(values) == 0 or len(values) % count != 0:
+            raise ValueError(f"wrong number of arguments for `{command}`")
+
+        for index in range(0, len(values), count):
+            v = values[index : index + count]
+            # offset for relative commands
+            offset = current if relative else 0j
+            if command == "M":
+                current = complex(v[0], v[1]) + offset
+                segments.append(_SvgMove(current, relative=relative))
+                start = current
+                # implicit commands following a move are lines
+                command = "L"
+                last = "M"
+                continue
+            elif command == "L":
+                end = complex(v[0], v[1]) + offset
+                segments.append(_SvgLine(current, end, relative=relative))
+            elif command == "H":
+                end = complex(v[0] + offset.real, current.imag)
+                segments.append(
+                    _SvgLine(current, end, relative=relative, horizontal=True)
+                )
+            elif command == "V":
+                end = complex(current.real, v[0] + offset.imag)
+                segments.append(_SvgLine(current, end, relative=relative, vertical=True))
+            elif command == "C":
+                end = complex(v[4], v[5]) + offset
+                segments.append(
+                    _SvgCubic(
+                        current,
+                        complex(v[0], v[1]) + offset,
+                        complex(v[2], v[3]) + offset,
+                        end,
+                        relative=relative,
+                    )
+                )
+            elif command == "S":
+                # reflect the previous control point
+                if last in ("C", "S"):
+                    control = 2.0 * current - segments[-1].control2
+                else:
+                    control = current
+                end = complex(v[2], v[3]) + offset
+                segments.append(
+                    _SvgCubic(
+                        current,
+                        control,
+                        complex(v[0], v[1]) + offset,
+                        end,
+                        relative=relative,
+                        smooth=True,
+                    )
+                )
+            elif command == "Q":
+                end = complex(v[2], v[3]) + offset
+                segments.append(
+                    _SvgQuadratic(
+                        current, complex(v[0], v[1]) + offset, end, relative=relative
+                    )
+                )
+            elif command == "T":
+                # reflect the previous control point
+                if last in ("Q", "T"):
+                    control = 2.0 * current - segments[-1].control
+                else:
+                    control = current
+                end = complex(v[0], v[1]) + offset
+                segments.append(
+                    _SvgQuadratic(current, control, end, relative=relative, smooth=True)
+                )
+            elif command == "A":
+                end = complex(v[5], v[6]) + offset
+                segments.append(
+                    _SvgArc(
+                        current,
+                        complex(v[0], v[1]),
+                        v[2],
+                        v[3],
+                        v[4],
+                        end,
+                        relative=relative,
+                    )
+                )
+            current = end
+            last = command
+
+    return segments
+
+
+def _affine2(points, matrix):
+    """
+    Apply a homogeneous 2D transform to points without
+    padding them into homogeneous coordinates.
 
-    return matrices
+    Parameters
+    ------------
+    points : (n, 2) float
+      Points in space.
+    matrix : (3, 3) float
+      Homogeneous transformation matrix.
+
+    Returns
+    ------------
+    transformed : (n, 2) float
+      Transformed points.
+    """
+    return points @ matrix[:2, :2].T + matrix[:2, 2]
 
 
 def _svg_path_convert(paths, force=None):
@@ -218,9 +531,6 @@ def _svg_path_convert(paths, force=None):
       Kwargs for Path2D constructor
     """
 
-    def complex_to_float(values):
-        return np.array([[i.real, i.imag] for i in values], dtype=np.float64)
-
     def load_multi(multi):
         # load a previously parsed multiline
         # start the count where indicated
@@ -232,10 +542,10 @@ def _svg_path_convert(paths, force=None):
 
     def load_arc(svg_arc):
         # load an SVG arc into a trimesh arc
-        points = complex_to_float([svg_arc.start, svg_arc.point(0.5), svg_arc.end])
-        # create an arc from the now numpy points
+        points = [svg_arc.start, svg_arc.point(0.5), svg_arc.end]
+        # create an arc referencing the new points
         arc = Arc(
-            points=np.arange(3) + counts[name],
+            points=np.arange(counts[name], counts[name] + 3),
             # we may have monkey-patched the entity to
             # indicate that it is a closed circle
             closed=getattr(svg_arc, "closed", False),
@@ -244,42 +554,84 @@ def _svg_path_convert(paths, force=None):
 
     def load_quadratic(svg_quadratic):
         # load a quadratic bezier spline
-        points = complex_to_float(
-            [svg_quadratic.start, svg_quadratic.control, svg_quadratic.end]
-        )
-        return Bezier(points=np.arange(3) + counts[name]), points
+        points = [svg_quadratic.start, svg_quadratic.control, svg_quadratic.end]
+        return Bezier(points=np.arange(counts[name], counts[name] + 3)), points
 
     def load_cubic(svg_cubic):
         # load a cubic bezier spline
-        points = complex_to_float(
-            [svg_cubic.start, svg_cubic.control1, svg_cubic.control2, svg_cubic.end]
-        )
-        return Bezier(np.arange(4) + counts[name]), points
+        points = [svg_cubic.start, svg_cubic.control1, svg_cubic.control2, svg_cubic.end]
+        return Bezier(np.arange(counts[name], counts[name] + 4)), points
 
     class MultiLine:
         # An object to hold one or multiple Line entities.
         def __init__(self, lines):
             if tol.strict:
                 # in unit tests make sure we only have lines
-                assert all(type(L).__name__ in ("Line", "Close") for L in lines)
+                assert all(isinstance(L, _SVG_LINE_TYPES) for L in lines)
             # get the starting point of every line
             points = [L.start for L in lines]
             # append the endpoint
             points.append(lines[-1].end)
-            # convert to (n, 2) float points
-            self.points = np.array([[i.real, i.imag] for i in points], dtype=np.float64)
+            # keep points as complex until the path is assembled
+            self.points = points
+
+    def combine(chunk, kind):
+        """
+        Combine a run of consecutive parsed segments which
+        all have the same code from `kinds_lookup`.
+        """
+        if kind == 1:
+            # if entity consists of lines add a multiline
+            return [MultiLine(chunk)]
+        elif kind == 2 and len(chunk) > 1:
+            # if we have multiple arcs check to see if they
+            # actually represent a single closed circle
+            # get a single array with the relevant arc points
+            verts = np.array(
+                [
+                    [
+                        a.start.real,
+                        a.start.imag,
+                        a.end.real,
+                        a.end.imag,
+                        a.center.real,
+                        a.center.imag,
+                        a.radius.real,
+                        a.radius.imag,
+                        a.rotation,
+                    ]
+                    for a in chunk
+                ],
+                dtype=np.float64,
+            )
+            # all arcs share the same center radius and rotation
+            if np.ptp(verts[:, 4:], axis=0).mean() < 1e-3:
+                start, end = verts[:, :2], verts[:, 2:4]
+                # if every end point matches the start point of a new
+                # arc that means this is really a closed circle made
+                # up of multiple arc segments
+                if util.allclose(start, np.roll(end, 1, axis=0)):
+                    # hot-patch a closed arc flag
+                    chunk[0].closed = True
+                    # all arcs in this block are now represented by one entity
+                    return chunk[:1]
+        # otherwise just add the entities individually
+        return chunk
 
-    # load functions for each entity
+    # load functions keyed by entity class
     loaders = {
-        "Arc": load_arc,
-        "MultiLine": load_multi,
-        "CubicBezier": load_cubic,
-        "QuadraticBezier": load_quadratic,
+        _SvgArc: load_arc,
+        MultiLine: load_multi,
+        _SvgCubic: load_cubic,
+        _SvgQuadratic: load_quadratic,
     }
+    # an integer code for entities we can combine
+    kinds_lookup = {_SvgLine: 1, _SvgClose: 1, _SvgArc: 2}
 
-    entities = collections.defaultdict(list)
-    vertices = collections.defaultdict(list)
-    counts = collections.defaultdict(lambda: 0)
+    # keyed by geometry name which are added on first use
+    entities = {}
+    vertices = {}
+    counts = {}
 
     for attrib, matrix in paths:
         # the path string is stored under `d`
@@ -290,107 +642,71 @@ def _svg_path_convert(paths, force=None):
 
         # get the name of the geometry if trimesh specified it
         # note that the get will by default return `None`
-        name = _decode(attrib.get(_ns + "name"))
-        # get parsed entities from svg.path
-        raw = np.array(list(parse_path(path_string)))
-
-        # if there is no path string exit
-        if len(raw) == 0:
-            continue
-
-        # create an integer code for entities we can combine
-        kinds_lookup = {"Line": 1, "Close": 1, "Arc": 2}
-        # get a code for each entity we parsed
-        kinds = np.array([kinds_lookup.get(type(i).__name__, 0) for i in raw], dtype=int)
-
-        # find groups of consecutive entities so we can combine
-        blocks = grouping.blocks(kinds, min_len=1, only_nonzero=False)
-
-        if tol.strict:
-            # in unit tests make sure we didn't lose any entities
-            assert util.allclose(np.hstack(blocks), np.arange(len(raw)))
+        name = _decode(attrib.get(_ns_key_name))
+        if name not in counts:
+            # the first path for this geometry name
+            entities[name] = []
+            vertices[name] = []
+            counts[name] = 0
 
         # Combine consecutive entities that can be represented
-        # more concisely as a single trimesh entity.
+        # more concisely as a single trimesh entity by streaming
+        # parsed segments into runs which share the same code
         parsed = []
-        for b in blocks:
-            chunk = raw[b]
-            current = type(raw[b[0]]).__name__
-            if current in ("Line", "Close"):
-                # if entity consists of lines add a multiline
-                parsed.append(MultiLine(chunk))
-            elif len(b) > 1 and current == "Arc":
-                # if we have multiple arcs check to see if they
-                # actually represent a single closed circle
-                # get a single array with the relevant arc points
-                verts = np.array(
-                    [
-                        [
-                            a.start.real,
-                            a.start.imag,
-                            a.end.real,
-                            a.end.imag,
-                            a.center.real,
-                            a.center.imag,
-                            a.radius.real,
-                            a.radius.imag,
-                            a.rotation,
-                        ]
-                        for a in chunk
-                    ],
-                    dtype=np.float64,
-                )
-                # all arcs share the same center radius and rotation
-                closed = False
-                if np.ptp(verts[:, 4:], axis=0).mean() < 1e-3:
-                    start, end = verts[:, :2], verts[:, 2:4]
-                    # if every end point matches the start point of a new
-                    # arc that means this is really a closed circle made
-                    # up of multiple arc segments
-                    closed = util.allclose(start, np.roll(end, 1, axis=0))
-                if closed:
-                    # hot-patch a closed arc flag
-                    chunk[0].closed = True
-                    # all arcs in this block are now represented by one entity
-                    parsed.append(chunk[0])
-                else:
-                    # we don't have a closed circle so add each
-                    # arc entity individually without combining
-                    parsed.extend(chunk)
-            else:
-                # otherwise just add the entities
-                parsed.extend(chunk)
+        run = []
+        current = None
+        for segment in _parse_path(path_string):
+            kind = kinds_lookup.get(type(segment), 0)
+            if kind != current:
+                if len(run) > 0:
+                    parsed.extend(combine(run, current))
+                run = []
+                current = kind
+            run.append(segment)
+        if len(run) > 0:
+            parsed.extend(combine(run, current))
+
         try:
             # try to retrieve any trimesh attributes as metadata
+            # slice off the prefix as `str.lstrip` strips a set of
+            # characters and would mangle keys like `color`
             entity_meta = {
-                k.lstrip(_ns): _decode(v)
-                for k, v in attrib.items()
-                if k[1:].startswith(_ns_url)
+                k[_ns_len:]: _decode(v) for k, v in attrib.items() if k.startswith(_ns)
             }
         except BaseException:
             entity_meta = {}
 
+        # untransformed vertices for every entity in this path
+        local = []
         # loop through parsed entity objects
         for svg_entity in parsed:
-            # keyed by entity class name
-            type_name = type(svg_entity).__name__
-            if type_name in loaders:
+            # keyed by entity class
+            loader = loaders.get(type(svg_entity))
+            if loader is not None:
                 # get new entities and vertices
-                e, v = loaders[type_name](svg_entity)
+                e, v = loader(svg_entity)
                 e.metadata.update(entity_meta)
                 # append them to the result
                 entities[name].append(e)
-                # transform the vertices by the matrix and append
-                vertices[name].append(transform_points(v, matrix))
+                local.extend(v)
                 counts[name] += len(v)
 
-    if len(vertices) == 0:
-        return {"vertices": [], "entities": []}
+        if len(local) > 0:
+            # view the complex points as interleaved (real, imag)
+            # floats and transform every vertex in the path at once
+            local = np.array(local, dtype=np.complex128).view(np.float64).reshape((-1, 2))
+            if matrix is not _IDENTITY:
+                local = _affine2(local, matrix)
+            vertices[name].append(local)
 
+    # skip any geometry whose paths didn't produce vertices
     geoms = {
         name: {"vertices": np.vstack(v), "entities": entities[name]}
         for name, v in vertices.items()
+        if len(v) > 0
     }
+    if len(geoms) == 0:
+        return {"vertices": [], "entities": []}
     if len(geoms) > 1 or force == "Scene":
         kwargs = {"geometry": geoms}
     else:
@@ -400,6 +716,95 @@ def _svg_path_convert(paths, force=None):
     return kwargs
 
 
+def _arc_svg_info(vertices):
+    """
+    Find the center, radius and SVG flags for many three
+    point arcs at once, matching `arc_center` on each arc.
+
+    Parameters
+    ------------
+    vertices : (n, 3, 2) float
+      Start, middle and end point of each arc.
+
+    Returns
+    ------------
+    center : (n, 2) float
+      Center of each arc.
+    radius : (n,) float
+      Radius of each arc.
+    large : (n,) bool
+      SVG large-arc flag, i.e. spans more than 180 degrees.
+    sweep : (n,) bool
+      SVG sweep flag, i.e. direction from start to end.
+    """
+    center, radius = _arc_center_radius(vertices)
+    # unit vectors from the center to each point on the arc
+    vectors = util.unitize((vertices - center[:, None]).reshape((-1, 2)))
+    span = _arc_span(vectors.reshape(vertices.shape), vertices)
+    # SVG arcs flag the long way around the circle
+    large = span > np.pi
+
+    # the sign of the 2D cross product gives the direction
+    start = vertices[:, 1] - vertices[:, 0]
+    chord = vertices[:, 2] - vertices[:, 0]
+    sweep = (start[:, 0] * chord[:, 1] - start[:, 1] * chord[:, 0]) > 0.0
+
+    return center, radius, large, sweep
+
+
+@lru_cache(maxsize=16)
+def _export_templates(digits):
+    """
+    Generate the path command templates for an SVG export.
+
+    Parameters
+    ------------
+    digits : int
+      Number of digits to format exports into
+
+    Returns
+    ------------
+    format_circle : callable
+      Format a closed circle from `x`, `y`, `r` and `d`.
+    format_arc : callable
+      Format a single arc from its endpoints, radius and flags.
+    temp_move : str
+      Printf-style template for an absolute move-to command.
+    temp_line : str
+      Printf-style template for an absolute line-to command.
+    temp_quadratic : str
+      Printf-style template for an absolute quadratic Bezier.
+    temp_cubic : str
+      Printf-style template for an absolute cubic Bezier.
+    """
+    # generate a format string with the requested digits
+    temp_digits = f"0.{digits}f"
+    # generate a format string for circles as two arc segments
+    temp_circle = (
+        "M {x:DI},{y:DI}a{r:DI},{r:DI},0,1,0,{d:DI}," + "0a{r:DI},{r:DI},0,1,0,-{d:DI},0Z"
+    ).replace("DI", temp_digits)
+    # generate a format string for a single arc
+    temp_arc = "M{SX:DI} {SY:DI}A{R},{R} 0 {L:d},{S:d} {EX:DI},{EY:DI}".replace(
+        "DI", temp_digits
+    )
+    # generate printf-style templates for absolute move-to and line
+    # commands which are faster than `str.format` for long polylines
+    temp_move = "M%{DI},%{DI}".replace("{DI}", temp_digits)
+    temp_line = "L%{DI},%{DI}".replace("{DI}", temp_digits)
+    # templates for Bezier curves after the move to their start
+    temp_quadratic = "Q%{DI},%{DI} %{DI},%{DI}".replace("{DI}", temp_digits)
+    temp_cubic = "C%{DI},%{DI} %{DI},%{DI} %{DI},%{DI}".replace("{DI}", temp_digits)
+
+    return (
+        temp_circle.format,
+        temp_arc.format,
+        temp_move,
+        temp_line,
+        temp_quadratic,
+        temp_cubic,
+    )
+
+
 def _entities_to_str(entities, vertices, name=None, digits=None, only_layers=None):
     """
     Convert the entities of a path to path strings.
@@ -422,54 +827,43 @@ def _entities_to_str(entities, vertices, name=None, digits=None, only_layers=Non
 
     points = vertices.copy()
 
-    # generate a format string with the requested digits
-    temp_digits = f"0.{int(digits)}f"
-    # generate a format string for circles as two arc segments
-    temp_circle = (
-        "M {x:DI},{y:DI}a{r:DI},{r:DI},0,1,0,{d:DI}," + "0a{r:DI},{r:DI},0,1,0,-{d:DI},0Z"
-    ).replace("DI", temp_digits)
-    # generate a format string for an absolute move-to command
-    temp_move = "M{:DI},{:DI}".replace("DI", temp_digits)
-    # generate a format string for an absolute-line command
-    temp_line = "L{:DI},{:DI}".replace("DI", temp_digits)
-    # generate a format string for a single arc
-    temp_arc = "M{SX:DI} {SY:DI}A{R},{R} 0 {L:d},{S:d} {EX:DI},{EY:DI}".replace(
-        "DI", temp_digits
+    # templates only depend on the digits so they are cached
+    (format_circle, format_arc, temp_move, temp_line, temp_quadratic, temp_cubic) = (
+        _export_templates(int(digits))
     )
 
-    def _cross_2d(a: NDArray, b: NDArray) -> Number:
-        """
-        Numpy 2.0 depreciated cross products of 2D arrays.
-        """
-        return a[0] * b[1] - a[1] * b[0]
-
-    def svg_arc(arc):
+    def svg_arc(arc, C, R, large_flag, sweep_flag):
         """
         arc string: (rx ry x-axis-rotation large-arc-flag sweep-flag x y)+
         large-arc-flag: greater than 180 degrees
         sweep flag: direction (cw/ccw)
         """
-        vertices = points[arc.points]
-        info = arc_center(vertices, return_normal=False, return_angle=True)
-        C, R, angle = info.center, info.radius, info.span
         if arc.closed:
-            return temp_circle.format(x=C[0] - R, y=C[1], r=R, d=2.0 * R)
+            return format_circle(x=C[0] - R, y=C[1], r=R, d=2.0 * R)
 
-        vertex_start, vertex_mid, vertex_end = vertices
-        large_flag = int(angle > np.pi)
-        sweep_flag = int(
-            _cross_2d(vertex_mid - vertex_start, vertex_end - vertex_start) > 0.0
-        )
-        return temp_arc.format(
+        vertex_start, _, vertex_end = points[arc.points]
+        return format_arc(
             SX=vertex_start[0],
             SY=vertex_start[1],
-            L=large_flag,
-            S=sweep_flag,
+            L=int(large_flag),
+            S=int(sweep_flag),
             EX=vertex_end[0],
             EY=vertex_end[1],
             R=R,
         )
 
+    def svg_bezier(entity):
+        """
+        Export a quadratic or cubic Bezier curve exactly
+        using the native SVG curve commands.
+        """
+        control = points[entity.points]
+        if len(control) == 3:
+            template = temp_move + temp_quadratic
+        else:
+            template = temp_move + temp_cubic
+        return template % tuple(control.ravel().tolist())
+
     def svg_discrete(entity):
         """
         Use an entities discrete representation to export a
@@ -479,25 +873,38 @@ def _entities_to_str(entities, vertices, name=None, digits=None, only_layers=Non
         # if entity contains no geometry return
         if len(discrete) == 0:
             return ""
-        # the format string for the SVG path
-        return (temp_move + (temp_line * (len(discrete) - 1))).format(
-            *discrete.reshape(-1)
+        # format native floats in a single pass
+        return (temp_move + (temp_line * (len(discrete) - 1))) % tuple(
+            discrete.ravel().tolist()
         )
 
+    # only export entities on the requested layers
+    if only_layers is not None:
+        entities = [e for e in entities if e.layer in only_layers]
+
+    # evaluate every arc at once keyed by entity index
+    arcs = {}
+    arc_index = [i for i, e in enumerate(entities) if e.__class__.__name__ == "Arc"]
+    if len(arc_index) > 0:
+        info = _arc_svg_info(points[[entities[i].points for i in arc_index]])
+        arcs = dict(zip(arc_index, zip(*info)))
+
     # tuples of (metadata, path string)
     pairs = []
 
-    for entity in entities:
-        if only_layers is not None and entity.layer not in only_layers:
-            continue
-        # check the class name of the entity
-        if entity.__class__.__name__ == "Arc":
+    for index, entity in enumerate(entities):
+        if index in arcs:
             # export the exact version of the entity
-            path_string = svg_arc(entity)
+            path_string = svg_arc(entity, *arcs[index])
+        elif entity.__class__.__name__ == "Bezier" and len(entity.points) in (3, 4):
+            # SVG can represent quadratic and cubic curves exactly
+            path_string = svg_bezier(entity)
         else:
             # just export the polyline version of the entity
             path_string = svg_discrete(entity)
-        meta = deepcopy(entity.metadata)
+        # metadata is only read after this so a shallow
+        # copy is enough to avoid mutating the entity
+        meta = entity.metadata.copy()
         if name is not None:
             meta["name"] = name
         pairs.append((meta, path_string))
@@ -566,10 +973,10 @@ def export_svg(drawing, return_path=False, only_layers=None, digits=None, **kwar
     # fetch the export template for the base SVG file
     template_svg = resources.get_string("templates/base.svg")
 
-    elements = []
-    for meta, path_string in pairs:
-        # create a simple path element
-        elements.append(f'<path d="{path_string}" {_format_attrib(meta)}/>')
+    # create a simple path element for every path string
+    elements = "\n".join(
+        f'<path d="{path_string}" {_format_attrib(meta)}/>' for meta, path_string in pairs
+    )
 
     # format as XML
     if "stroke_width" in kwargs:
@@ -585,7 +992,7 @@ def export_svg(drawing, return_path=False, only_layers=None, digits=None, **kwar
         log.debug("failed to encode", exc_info=True)
 
     subs = {
-        "elements": "\n".join(elements),
+        "elements": elements,
         "min_x": drawing.bounds[0][0],
         "min_y": drawing.bounds[0][1],
         "width": drawing.extents[0],
@@ -605,11 +1012,10 @@ def _format_attrib(attrib):
     attrib : dict
       Bag of keys and values.
     """
-    bag = {k: _encode(v) for k, v in attrib.items()}
+    # encode values in the same pass that formats them
+    encoded = ((k, _encode(v)) for k, v in attrib.items() if len(k) > 0)
     return "\n".join(
-        f'{_ns_name}:{k}="{v}"'
-        for k, v in bag.items()
-        if len(k) > 0 and v is not None and len(v) > 0
+        f'{_ns_name}:{k}="{v}"' for k, v in encoded if v is not None and len(v) > 0
     )
 
 
@@ -619,15 +1025,18 @@ def _encode(stuff):
 
     Parameters
     -----------
-    stuff : dict, str
+    stuff : dict, str, or None
       Thing to pack
 
     Returns
     ------------
-    encoded : str
+    encoded : str or None
       Packaged into url-safe b64 string
     """
-    if isinstance(stuff, str) and '"' not in stuff:
+    if stuff is None:
+        # nothing to pack
+        return None
+    elif isinstance(stuff, str) and '"' not in stuff:
         return stuff
     pack = base64.urlsafe_b64encode(
         jsonify(
@@ -11,7 +11,7 @@ from . import util
 from .constants import log_time, tol
 from .grouping import group_min
 from .triangles import closest_point as _corresponding
-from .triangles import points_to_barycentric
+from .triangles import points_to_barycentric, precompute_closest
 
 try:
     from scipy.spatial import cKDTree
@@ -71,8 +71,8 @@ def closest_point_naive(mesh, points):
     Given a mesh and a list of points find the closest point
     on any triangle.
 
-    Does this by constructing a very large intermediate array and
-    comparing every point to every triangle.
+    Does this by comparing every point to every triangle, a
+    block of points at a time to keep memory bounded.
 
     Parameters
     ----------
@@ -99,20 +99,33 @@ def closest_point_naive(mesh, points):
     if not util.is_shape(points, (-1, 3)):
         raise ValueError("points must be (n,3)")
 
-    # create a giant tiled array of each point tiled len(triangles) times
-    points_tiled = np.tile(points, (1, len(triangles)))
-    on_triangle = np.array(
-        [_corresponding(triangles, i.reshape((-1, 3))) for i in points_tiled]
-    )
-
-    # distance squared
-    distance_2 = [((i - q) ** 2).sum(axis=1) for i, q in zip(on_triangle, points)]
-
-    triangle_id = np.array([i.argmin() for i in distance_2])
-
-    # closest cartesian point
-    closest = np.array([g[i] for i, g in zip(triangle_id, on_triangle)])
-    distance = np.array([g[i] for i, g in zip(triangle_id, distance_2)]) ** 0.5
+    # compute the edge vectors once and reuse them for every point
+    cache = precompute_closest(triangles)
+    count = len(triangles)
+
+    # evaluate several points per call if there are few triangles
+    # and only keep the closest candidate for each point
+    per_block = max(1, 4096 // count)
+    tiled = cache[np.tile(np.arange(count), min(per_block, len(points)))]
+
+    closest = np.zeros_like(points)
+    distance = np.zeros(len(points), dtype=np.float64)
+    triangle_id = np.zeros(len(points), dtype=np.int64)
+    for start in range(0, len(points), per_block):
+        block = points[start : start + per_block]
+        # every triangle paired with every point in the block
+        on_triangle = _corresponding(
+            tiled[: len(block) * count], np.repeat(block, count, axis=0)
+        ).reshape((len(block), count, 3))
+
+        # distance squared
+        distance_2 = ((on_triangle - block[:, None, :]) ** 2).sum(axis=2)
+        index = distance_2.argmin(axis=1)
+        rows = np.arange(len(block))
+
+        closest[start : start + per_block] = on_triangle[rows, index]
+        distance[start : start + per_block] = distance_2[rows, index] ** 0.5
+        triangle_id[start : start + per_block] = index
 
     return closest, distance, triangle_id
 